@@ -2,6 +2,7 @@ from pytools import memoize
 
 # don't import pycuda.driver here--you'll create an import loop
 import os
+import re
 
 import sys
 from tempfile import mkstemp
@@ -78,6 +79,47 @@ def preprocess_source(source, options, nvcc):
     return preprocessed_str.replace(os.path.basename(source_path), "")
 
 
+_INCLUDE_RE = re.compile(r"^\s*#\s*include\b(.*)$", re.MULTILINE)
+_INCLUDE_OPTION_PREFIXES = (
+    "-I", "--include-path", "-isystem", "--system-include",
+    "-include", "--pre-include")
+
+
+@memoize
+def _get_pycuda_headers():
+    """Return a :class:`dict` mapping names of PyCUDA's own headers to their
+    contents.
+    """
+    include_path = _find_pycuda_include_path()
+    result = {}
+    for name in os.listdir(include_path):
+        with open(os.path.join(include_path, name), "rb") as inf:
+            result[name] = inf.read()
+
+    return result
+
+
+def _includes_only_pycuda_headers(source, options):
+    """Return *True* if the only headers that *source* may pull in are
+    PyCUDA's own (which in turn only include CUDA headers, whose contents are
+    pinned down by the version of :program:`nvcc`).
+    """
+    pycuda_include_option = "-I" + _find_pycuda_include_path()
+    if any(option.startswith(_INCLUDE_OPTION_PREFIXES)
+           and option != pycuda_include_option
+           for option in options):
+        return False
+
+    headers = _get_pycuda_headers()
+    for include in _INCLUDE_RE.findall(source):
+        include = include.strip()
+        if not (include[:1] in "<\"" and include[1:-1] in headers
+                and include[-1:] in ">\""):
+            return False
+
+    return True
+
+
 def compile_plain(source, options, keep, nvcc, cache_dir, target="cubin"):
     from os.path import join
 
@@ -86,10 +128,18 @@ def compile_plain(source, options, keep, nvcc, cache_dir, target="cubin"):
     if cache_dir:
         checksum = _new_md5()
 
-        if "#include" in source:
-            checksum.update(preprocess_source(source, options, nvcc).encode("utf-8"))
-        else:
+        if "#include" not in source:
             checksum.update(source.encode("utf-8"))
+        elif _includes_only_pycuda_headers(source, options):
+            # Avoid spawning the preprocessor on every cache lookup: hashing
+            # the (known) headers identifies the translation unit just as well.
+            checksum.update(source.encode("utf-8"))
+            headers = _get_pycuda_headers()
+            for name in sorted(headers):
+                checksum.update(name.encode("utf-8"))
+                checksum.update(headers[name])
+        else:
+            checksum.update(preprocess_source(source, options, nvcc).encode("utf-8"))
 
         for option in options:
             checksum.update(option.encode("utf-8"))
@@ -178,9 +228,30 @@ def compile_plain(source, options, keep, nvcc, cache_dir, target="cubin"):
     result_f.close()
 
     if cache_dir:
-        outf = open(cache_path, "wb")
-        outf.write(result_data)
-        outf.close()
+        # Write to a temporary file and rename it into place, so that
+        # concurrent processes never pick up a partially written binary.
+        # Failing to write the cache entry does not fail the compilation.
+        from uuid import uuid4
+
+        tmp_cache_path = "%s.%s.tmp" % (cache_path, uuid4().hex)
+        try:
+            # unlike mkstemp, this creates the file with the permissions a
+            # plain open() would give it
+            handle = os.open(tmp_cache_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                    | getattr(os, "O_BINARY", 0), 0o666)
+        except OSError:
+            pass
+        else:
+            try:
+                with os.fdopen(handle, "wb") as outf:
+                    outf.write(result_data)
+                os.replace(tmp_cache_path, cache_path)
+            except OSError:
+                _remove_if_exists(tmp_cache_path)
+            except BaseException:
+                _remove_if_exists(tmp_cache_path)
+                raise
 
     if not keep:
         from os import listdir, unlink, rmdir
@@ -192,6 +263,13 @@ def compile_plain(source, options, keep, nvcc, cache_dir, target="cubin"):
     return result_data
 
 
+def _remove_if_exists(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 def _get_per_user_string():
     try:
         from os import getuid
@@ -1,4 +1,3 @@
-import pycuda.gpuarray as gpuarray
 import pycuda.elementwise as elementwise
 import numpy as np
 import warnings
@@ -80,14 +79,16 @@ tanh = _make_unary_array_func("tanh")
 def fmod(arg, mod, stream=None):
     """Return the floating point remainder of the division `arg/mod`,
     for each element in `arg` and `mod`."""
-    result = gpuarray.GPUArray(arg.shape, arg.dtype)
+    result = arg._new_like_me()
 
     if not arg.flags.forc or not mod.flags.forc:
         raise RuntimeError(
             "only contiguous arrays may " "be used as arguments to this operation"
         )
+    if arg.dtype != mod.dtype:
+        raise TypeError("arg and mod must have the same dtype")
 
-    func = elementwise.get_fmod_kernel()
+    func = elementwise.get_fmod_kernel(arg.dtype)
     func.prepared_async_call(
         arg._grid,
         arg._block,
@@ -110,10 +111,10 @@ def frexp(arg, stream=None):
             "only contiguous arrays may " "be used as arguments to this operation"
         )
 
-    sig = gpuarray.GPUArray(arg.shape, arg.dtype)
-    expt = gpuarray.GPUArray(arg.shape, arg.dtype)
+    sig = arg._new_like_me()
+    expt = arg._new_like_me()
 
-    func = elementwise.get_frexp_kernel()
+    func = elementwise.get_frexp_kernel(arg.dtype)
     func.prepared_async_call(
         arg._grid,
         arg._block,
@@ -136,10 +137,12 @@ def ldexp(significand, exponent, stream=None):
         raise RuntimeError(
             "only contiguous arrays may " "be used as arguments to this operation"
         )
+    if significand.dtype != exponent.dtype:
+        raise TypeError("significand and exponent must have the same dtype")
 
-    result = gpuarray.GPUArray(significand.shape, significand.dtype)
+    result = significand._new_like_me()
 
-    func = elementwise.get_ldexp_kernel()
+    func = elementwise.get_ldexp_kernel(significand.dtype)
     func.prepared_async_call(
         significand._grid,
         significand._block,
@@ -162,10 +165,10 @@ def modf(arg, stream=None):
             "only contiguous arrays may " "be used as arguments to this operation"
         )
 
-    intpart = gpuarray.GPUArray(arg.shape, arg.dtype)
-    fracpart = gpuarray.GPUArray(arg.shape, arg.dtype)
+    intpart = arg._new_like_me()
+    fracpart = arg._new_like_me()
 
-    func = elementwise.get_modf_kernel()
+    func = elementwise.get_modf_kernel(arg.dtype)
     func.prepared_async_call(
         arg._grid,
         arg._block,
@@ -161,6 +161,9 @@ class InOut(In, Out):
 
 
 def _add_functionality():
+    # imported once here rather than in each (hot) launch wrapper
+    from pycuda._pvt_struct import pack
+
     def device_get_attributes(dev):
         result = {}
 
@@ -229,8 +232,6 @@ def _add_functionality():
                     arg_data.append(int(gpudata))
                     format += "P"
 
-        from pycuda._pvt_struct import pack
-
         return handlers, pack(format, *arg_data)
 
     # {{{ pre-CUDA 4 call interface (stateful)
@@ -369,8 +370,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         func._param_setv(0, pack(func.arg_format, *args))
 
         for texref in func.texrefs:
@@ -401,8 +400,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         func._param_setv(0, pack(func.arg_format, *args))
 
         for texref in func.texrefs:
@@ -445,8 +442,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         func._param_setv(0, pack(func.arg_format, *args))
 
         for texref in func.texrefs:
@@ -478,7 +473,6 @@ def _add_functionality():
         if block is None:
             raise ValueError("must specify block size")
 
-        func._set_block_shape(*block)
         handlers, arg_buf = _build_arg_buf(args)
 
         for handler in handlers:
@@ -543,9 +537,9 @@ def _add_functionality():
         return func
 
     def function_prepared_call(func, grid, block, *args, **kwargs):
-        if isinstance(block, tuple):
-            func._set_block_shape(*block)
-        else:
+        # The block shape is passed to cuLaunchKernel directly, a separate
+        # cuFuncSetBlockShape would only cost an extra driver call.
+        if not isinstance(block, tuple):
             from warnings import warn
 
             warn(
@@ -563,8 +557,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         arg_buf = pack(func.arg_format, *args)
 
         for texref in func.texrefs:
@@ -579,8 +571,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         arg_buf = pack(func.arg_format, *args)
 
         for texref in func.texrefs:
@@ -600,9 +590,7 @@ def _add_functionality():
         return get_call_time
 
     def function_prepared_async_call(func, grid, block, stream, *args, **kwargs):
-        if isinstance(block, tuple):
-            func._set_block_shape(*block)
-        else:
+        if not isinstance(block, tuple):
             from warnings import warn
 
             warn(
@@ -621,8 +609,6 @@ def _add_functionality():
                 "unknown keyword arguments: " + ", ".join(kwargs.keys())
             )
 
-        from pycuda._pvt_struct import pack
-
         arg_buf = pack(func.arg_format, *args)
 
         for texref in func.texrefs:
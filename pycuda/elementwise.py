@@ -33,6 +33,26 @@ from pycuda.tools import dtype_to_ctype, VectorArg, ScalarArg
 from pytools import memoize_method
 
 
+def _get_launch_bounds(max_threads_per_block):
+    if max_threads_per_block is None:
+        return ""
+    else:
+        return "__launch_bounds__(%d) " % max_threads_per_block
+
+
+def _get_declarator(arg, restrict_outputs):
+    """Return the declarator of *arg*. If *restrict_outputs* is not *None*,
+    it contains the names of the vector arguments that are written; vector
+    arguments are then declared ``__restrict__`` and, unless written, ``const``.
+    """
+    if restrict_outputs is None or not isinstance(arg, VectorArg):
+        return arg.declarator()
+
+    return "{}{} *__restrict__ {}".format(
+        "" if arg.name in restrict_outputs else "const ",
+        dtype_to_ctype(arg.dtype), arg.name)
+
+
 def get_elwise_module(
     arguments,
     operation,
@@ -42,6 +62,8 @@ def get_elwise_module(
     preamble="",
     loop_prep="",
     after_loop="",
+    max_threads_per_block=None,
+    restrict_outputs=None,
 ):
     from pycuda.compiler import SourceModule
     return SourceModule(
@@ -51,7 +73,7 @@ def get_elwise_module(
         %(preamble)s
 
         extern "C"
-        __global__ void %(name)s(%(arguments)s)
+        __global__ void %(launch_bounds)s%(name)s(%(arguments)s)
         {
 
           size_t tid = threadIdx.x;
@@ -70,12 +92,14 @@ def get_elwise_module(
         }
         """
         % {
-            "arguments": ", ".join(arg.declarator() for arg in arguments),
+            "arguments": ", ".join(
+                _get_declarator(arg, restrict_outputs) for arg in arguments),
             "operation": operation,
             "name": name,
             "preamble": preamble,
             "loop_prep": loop_prep,
             "after_loop": after_loop,
+            "launch_bounds": _get_launch_bounds(max_threads_per_block),
         },
         options=options,
         keep=keep,
@@ -92,6 +116,8 @@ def get_elwise_range_module(
     preamble="",
     loop_prep="",
     after_loop="",
+    max_threads_per_block=None,
+    restrict_outputs=None,
 ):
     from pycuda.compiler import SourceModule
 
@@ -102,7 +128,7 @@ def get_elwise_range_module(
         %(preamble)s
 
         extern "C"
-        __global__ void %(name)s(%(arguments)s)
+        __global__ void %(launch_bounds)s%(name)s(%(arguments)s)
         {
           size_t tid = threadIdx.x;
           size_t total_threads = gridDim.x*blockDim.x;
@@ -132,12 +158,14 @@ def get_elwise_range_module(
         }
         """
         % {
-            "arguments": ", ".join(arg.declarator() for arg in arguments),
+            "arguments": ", ".join(
+                _get_declarator(arg, restrict_outputs) for arg in arguments),
             "operation": operation,
             "name": name,
             "preamble": preamble,
             "loop_prep": loop_prep,
             "after_loop": after_loop,
+            "launch_bounds": _get_launch_bounds(max_threads_per_block),
         },
         options=options,
         keep=keep,
@@ -285,6 +313,12 @@ class ElementwiseKernel:
             grid = repr_vec._grid
             invocation_args.append(repr_vec.mem_size)
 
+        # the kernel loops over its indices with a grid-sized stride, so
+        # shrinking the block to the declared launch bound stays correct
+        max_threads_per_block = self.gen_kwargs.get("max_threads_per_block")
+        if max_threads_per_block is not None and block[0] > max_threads_per_block:
+            block = (max_threads_per_block, 1, 1)
+
         func.prepared_async_call(grid, block, stream, *invocation_args)
 
 
@@ -470,12 +504,14 @@ def _get_real_dtype(dtype: "np.dtype[Any]") -> "np.dtype[Any]":
 
 @context_dependent_memoize
 def get_axpbyz_kernel(dtype_x, dtype_y, dtype_z,
-                    x_is_scalar=False, y_is_scalar=False):
+                    x_is_scalar=False, y_is_scalar=False, restrict=False):
     """
     Returns a kernel corresponding to ``z = ax + by``.
 
     :arg x_is_scalar: A :class:`bool` which is *True* only if `x` is a scalar :class:`gpuarray`.
     :arg y_is_scalar: A :class:`bool` which is *True* only if `y` is a scalar :class:`gpuarray`.
+    :arg restrict: A :class:`bool` which may be *True* only if `z` overlaps
+        neither `x` nor `y`.
     """
     out_t = dtype_to_ctype(dtype_z)
 
@@ -511,27 +547,42 @@ def get_axpbyz_kernel(dtype_x, dtype_y, dtype_z,
         },
         f"z[i] = {result}",
         "axpbyz",
+        restrict_outputs=("z",) if restrict else None,
     )
 
 
 @context_dependent_memoize
-def get_axpbz_kernel(dtype_x, dtype_z):
+def get_axpbz_kernel(dtype_x, dtype_z, restrict=False):
     return get_elwise_kernel(
         "%(tp_z)s a, %(tp_x)s *x,%(tp_z)s b, %(tp_z)s *z"
         % {"tp_x": dtype_to_ctype(dtype_x), "tp_z": dtype_to_ctype(dtype_z)},
         "z[i] = a * x[i] + b",
         "axpb",
+        restrict_outputs=("z",) if restrict else None,
+    )
+
+
+@context_dependent_memoize
+def get_scale_kernel(dtype_x, dtype_z, restrict=False):
+    return get_elwise_kernel(
+        "%(tp_z)s a, %(tp_x)s *x, %(tp_z)s *z"
+        % {"tp_x": dtype_to_ctype(dtype_x), "tp_z": dtype_to_ctype(dtype_z)},
+        "z[i] = a * x[i]",
+        "scale",
+        restrict_outputs=("z",) if restrict else None,
     )
 
 
 @context_dependent_memoize
 def get_binary_op_kernel(dtype_x, dtype_y, dtype_z, operator,
-                        x_is_scalar=False, y_is_scalar=False):
+                        x_is_scalar=False, y_is_scalar=False, restrict=False):
     """
     Returns a kernel corresponding to ``z = x (operator) y``.
 
     :arg x_is_scalar: A :class:`bool` which is *True* only if `x` is a scalar :class:`gpuarray`.
     :arg y_is_scalar: A :class:`bool` which is *True* only if `y` is a scalar :class:`gpuarray`.
+    :arg restrict: A :class:`bool` which may be *True* only if `z` overlaps
+        neither `x` nor `y`.
     """
 
     out_t = dtype_to_ctype(dtype_z)
@@ -566,9 +617,111 @@ def get_binary_op_kernel(dtype_x, dtype_y, dtype_z, operator,
         },
         f"z[i] = ({out_t}) {result}",
         "multiply",
+        restrict_outputs=("z",) if restrict else None,
     )
 
 
+# {{{ float4-vectorized kernels
+
+# These process four float32 entries per thread and iteration, so that the
+# memory traffic of contiguous, suitably aligned arrays travels in 128-bit
+# loads and stores. *n* counts float4 vectors, not scalars.
+
+
+def _make_float4(expr):
+    """Return a ``make_float4(...)`` evaluating *expr* for each of the
+    components, which *expr* refers to as ``%(c)s``.
+    """
+    return "make_float4(%s)" % ", ".join(expr % {"c": c} for c in "xyzw")
+
+
+@context_dependent_memoize
+def get_axpbyz_float4_kernel(restrict=False):
+    """
+    Returns a kernel corresponding to ``z = ax + by`` for float32 vectors
+    `x`, `y` and `z` reinterpreted as ``float4``.
+    """
+    from pycuda.gpuarray import vec
+
+    return get_elwise_kernel(
+        [
+            ScalarArg(np.float32, "a"),
+            VectorArg(vec.float4, "x"),
+            ScalarArg(np.float32, "b"),
+            VectorArg(vec.float4, "y"),
+            VectorArg(vec.float4, "z"),
+        ],
+        "float4 xi = x[i], yi = y[i]; "
+        "z[i] = " + _make_float4("a*xi.%(c)s + b*yi.%(c)s"),
+        "axpbyz_float4",
+        restrict_outputs=("z",) if restrict else None,
+    )
+
+
+@context_dependent_memoize
+def get_axpbz_float4_kernel(restrict=False):
+    """
+    Returns a kernel corresponding to ``z = ax + b`` for float32 vectors
+    `x` and `z` reinterpreted as ``float4``.
+    """
+    from pycuda.gpuarray import vec
+
+    return get_elwise_kernel(
+        [
+            ScalarArg(np.float32, "a"),
+            VectorArg(vec.float4, "x"),
+            ScalarArg(np.float32, "b"),
+            VectorArg(vec.float4, "z"),
+        ],
+        "float4 xi = x[i]; z[i] = " + _make_float4("a*xi.%(c)s + b"),
+        "axpb_float4",
+        restrict_outputs=("z",) if restrict else None,
+    )
+
+
+@context_dependent_memoize
+def get_scale_float4_kernel(restrict=False):
+    """
+    Returns a kernel corresponding to ``z = ax`` for float32 vectors
+    `x` and `z` reinterpreted as ``float4``.
+    """
+    from pycuda.gpuarray import vec
+
+    return get_elwise_kernel(
+        [
+            ScalarArg(np.float32, "a"),
+            VectorArg(vec.float4, "x"),
+            VectorArg(vec.float4, "z"),
+        ],
+        "float4 xi = x[i]; z[i] = " + _make_float4("a*xi.%(c)s"),
+        "scale_float4",
+        restrict_outputs=("z",) if restrict else None,
+    )
+
+
+@context_dependent_memoize
+def get_binary_op_float4_kernel(operator, restrict=False):
+    """
+    Returns a kernel corresponding to ``z = x (operator) y`` for float32
+    vectors `x`, `y` and `z` reinterpreted as ``float4``.
+    """
+    from pycuda.gpuarray import vec
+
+    return get_elwise_kernel(
+        [
+            VectorArg(vec.float4, "x"),
+            VectorArg(vec.float4, "y"),
+            VectorArg(vec.float4, "z"),
+        ],
+        "float4 xi = x[i], yi = y[i]; "
+        "z[i] = " + _make_float4("xi.%%(c)s %s yi.%%(c)s" % operator),
+        "binary_op_float4",
+        restrict_outputs=("z",) if restrict else None,
+    )
+
+# }}}
+
+
 @context_dependent_memoize
 def get_rdivide_elwise_kernel(dtype_x, dtype_z):
     return get_elwise_kernel(
@@ -741,25 +894,29 @@ def get_pow_array_kernel(dtype_x, dtype_y, dtype_z, is_base_array, is_exp_array)
 
 
 @context_dependent_memoize
-def get_fmod_kernel():
+def get_fmod_kernel(dtype=np.float32):
     return get_elwise_kernel(
-        "float *arg, float *mod, float *z", "z[i] = fmod(arg[i], mod[i])", "fmod_kernel"
+        "%(tp)s *arg, %(tp)s *mod, %(tp)s *z" % {"tp": dtype_to_ctype(dtype)},
+        "z[i] = fmod(arg[i], mod[i])",
+        "fmod_kernel",
     )
 
 
 @context_dependent_memoize
-def get_modf_kernel():
+def get_modf_kernel(dtype=np.float32):
     return get_elwise_kernel(
-        "float *x, float *intpart ,float *fracpart",
+        "%(tp)s *x, %(tp)s *intpart ,%(tp)s *fracpart"
+        % {"tp": dtype_to_ctype(dtype)},
         "fracpart[i] = modf(x[i], &intpart[i])",
         "modf_kernel",
     )
 
 
 @context_dependent_memoize
-def get_frexp_kernel():
+def get_frexp_kernel(dtype=np.float32):
     return get_elwise_kernel(
-        "float *x, float *significand, float *exponent",
+        "%(tp)s *x, %(tp)s *significand, %(tp)s *exponent"
+        % {"tp": dtype_to_ctype(dtype)},
         """
                 int expt = 0;
                 significand[i] = frexp(x[i], &expt);
@@ -770,9 +927,9 @@ def get_frexp_kernel():
 
 
 @context_dependent_memoize
-def get_ldexp_kernel():
+def get_ldexp_kernel(dtype=np.float32):
     return get_elwise_kernel(
-        "float *sig, float *expt, float *z",
+        "%(tp)s *sig, %(tp)s *expt, %(tp)s *z" % {"tp": dtype_to_ctype(dtype)},
         "z[i] = ldexp(sig[i], int(expt[i]))",
         "ldexp_kernel",
     )
@@ -5,7 +5,7 @@ Copyright 2021 NVIDIA Corporation
 
 import numpy as np
 import pycuda.elementwise as elementwise
-from pytools import memoize, memoize_method
+from pytools import memoize
 import pycuda.driver as drv
 from pycuda.compyte.array import (
     as_strided as _as_strided,
@@ -15,7 +15,8 @@ from pycuda.compyte.array import (
     get_common_dtype as _get_common_dtype_base,
 )
 from pycuda.characterize import has_double_support
-from functools import reduce
+from pycuda.tools import context_dependent_memoize
+from functools import cached_property, reduce
 import numbers
 
 import copyreg
@@ -110,10 +111,12 @@ def _splay_backend(n, dev):
     devdata = DeviceData(dev)
 
     min_threads = devdata.warp_size
-    max_threads = 128
+    max_threads = min(256, devdata.max_threads)
+    # enough blocks of max_threads to fill every multiprocessor once;
+    # the elementwise kernels loop over any remaining entries
     max_blocks = (
-        4
-        * devdata.thread_blocks_per_mp
+        dev.get_attribute(drv.device_attribute.MAX_THREADS_PER_MULTIPROCESSOR)
+        // max_threads
         * dev.get_attribute(drv.device_attribute.MULTIPROCESSOR_COUNT)
     )
 
@@ -141,6 +144,156 @@ def splay(n, dev=None):
     return _splay_backend(n, dev)
 
 
+# Checked by exact type before falling back to the slower numpy.isscalar, so
+# that the arithmetic operators dispatch common scalars quickly.
+_SCALAR_TYPES = frozenset([
+    bool, int, float, complex,
+    np.bool_, np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64,
+    np.float32, np.float64, np.complex64, np.complex128])
+
+
+def _is_scalar(obj):
+    return type(obj) in _SCALAR_TYPES or np.isscalar(obj)
+
+
+def _is_float4_vectorizable(*arys):
+    """Return *True* if the contiguous arrays *arys* may be processed by the
+    ``float4`` kernels of :mod:`pycuda.elementwise`, i.e. if they are all
+    non-empty float32 arrays of a size divisible by four, starting at a
+    16-byte aligned address.
+    """
+    for ary in arys:
+        if not (ary.dtype == np.float32
+                and ary.size > 0
+                and ary.size % 4 == 0
+                and int(ary.gpudata) % 16 == 0):
+            return False
+
+    return True
+
+
+def _overlaps(out, *arys):
+    """Return *True* if the device memory of the contiguous array *out*
+    overlaps with that of any of the contiguous arrays *arys*.
+    """
+    if not out.size:
+        return False
+
+    out_start = int(out.gpudata)
+    for ary in arys:
+        if not ary.size:
+            continue
+
+        start = int(ary.gpudata)
+        if start < out_start + out.nbytes and out_start < start + ary.nbytes:
+            return True
+
+    return False
+
+
+def _negate_scalar(value, dtype):
+    """Return the negation of *value* in *dtype*, wrapping around for
+    unsigned *dtype* without the overflow warning of numpy scalars.
+    """
+    return np.negative(np.array(value, dtype=dtype))[()]
+
+
+def _is_pagelocked(ary):
+    """Return *True* if the memory underlying the :class:`numpy.ndarray` *ary*
+    is page-locked, i.e. may be transferred to and from the device by DMA.
+    """
+    pagelocked_types = (
+        drv.PagelockedHostAllocation,
+        drv.RegisteredHostMemory,
+        drv.PooledHostAllocation)
+
+    while ary is not None and not isinstance(ary, pagelocked_types):
+        ary = getattr(ary, "base", None)
+
+    return ary is not None
+
+
+# Transfers at most this large are staged through buffers that are kept for
+# reuse, of which there are at most _STAGING_BUFFER_COUNT per context.
+_STAGING_BUFFER_NBYTES = 1 << 24
+_STAGING_BUFFER_COUNT = 2
+
+
+class _StagingBuffer:
+    def __init__(self, nbytes):
+        self.buffer = drv.pagelocked_empty(
+            nbytes, np.uint8, mem_flags=drv.host_alloc_flags.PORTABLE)
+        # marks the completion of the last transfer involving *buffer*
+        self.done = drv.Event()
+
+    def view(self, shape, dtype, strides):
+        nbytes = dtype.itemsize
+        for dim in shape:
+            nbytes *= dim
+
+        return _as_strided(self.buffer[:nbytes].view(dtype),
+                           shape=shape, strides=strides)
+
+
+class _PinnedStagingBuffers:
+    """Page-locked host buffers through which transfers from and to pageable
+    memory may be routed.
+
+    Buffers for transfers of up to :data:`_STAGING_BUFFER_NBYTES` are kept
+    and reused, so that transfers on different streams need not wait for
+    each other. Buffers for larger transfers are released once the transfer
+    has completed.
+    """
+
+    def __init__(self):
+        self.reusable = []
+        # larger buffers kept alive until their asynchronous transfer is done
+        self.pending = []
+
+    def get(self, nbytes):
+        """Return a :class:`_StagingBuffer` of at least *nbytes* that is not
+        in use by a transfer. Raises :exc:`pycuda.driver.MemoryError` if
+        page-locked memory cannot be allocated.
+        """
+        self.pending = [buf for buf in self.pending if not buf.done.query()]
+
+        if nbytes > _STAGING_BUFFER_NBYTES:
+            return _StagingBuffer(nbytes)
+
+        idle = [buf for buf in self.reusable if buf.done.query()]
+        for buf in idle:
+            if buf.buffer.nbytes >= nbytes:
+                break
+        else:
+            if len(self.reusable) < _STAGING_BUFFER_COUNT:
+                buf = _StagingBuffer(nbytes)
+                self.reusable.append(buf)
+            else:
+                # grow an idle buffer, or the one that has been in use longest
+                old_buf = idle[0] if idle else self.reusable[0]
+                old_buf.done.synchronize()
+                self.reusable.remove(old_buf)
+                buf = _StagingBuffer(max(nbytes, old_buf.buffer.nbytes))
+                self.reusable.append(buf)
+
+        # keep the buffers in order of use
+        self.reusable.remove(buf)
+        self.reusable.append(buf)
+        return buf
+
+    def record(self, buf, stream):
+        """Mark *buf* as in use by a transfer just enqueued on *stream*."""
+        buf.done.record(stream)
+        if buf not in self.reusable:
+            self.pending.append(buf)
+
+
+@context_dependent_memoize
+def _get_pinned_staging_buffers():
+    return _PinnedStagingBuffers()
+
+
 # }}}
 
 
@@ -274,7 +427,17 @@ class GPUArray:
             self.gpudata = gpudata
         self.base = base
 
-        self._grid, self._block = splay(self.mem_size)
+    # Launch configurations (and, below, flags) are only computed for arrays
+    # that are actually operated upon, not for views and temporaries that are
+    # merely passed around. Once computed, they are plain attribute lookups.
+
+    @cached_property
+    def _grid(self):
+        return splay(self.mem_size)[0]
+
+    @cached_property
+    def _block(self):
+        return splay(self.mem_size)[1]
 
     @property
     def __cuda_array_interface__(self):
@@ -300,12 +463,11 @@ class GPUArray:
     def ndim(self):
         return len(self.shape)
 
-    @property
-    @memoize_method
+    @cached_property
     def flags(self):
         return _ArrayFlags(self)
 
-    def set(self, ary, async_=False, stream=None, **kwargs):
+    def set(self, ary, async_=False, stream=None, pagelocked=False, **kwargs):
         # {{{ handle 'async' deprecation
 
         async_arg = kwargs.pop("async", None)
@@ -334,7 +496,28 @@ class GPUArray:
             raise ValueError("ary and self must have the same dtype")
 
         if self.size:
-            _memcpy_discontig(self, ary, async_=async_, stream=stream)
+            # Asynchronous copies from pageable memory are performed
+            # synchronously by the driver, so stage those as well unless
+            # that would take a large amount of page-locked memory.
+            staging_buf = None
+            if ((pagelocked or (async_ and self.nbytes <= _STAGING_BUFFER_NBYTES))
+                    and not _is_pagelocked(ary)):
+                staging = _get_pinned_staging_buffers()
+                try:
+                    staging_buf = staging.get(self.nbytes)
+                except drv.MemoryError:
+                    pass
+
+            if staging_buf is not None:
+                host_ary = staging_buf.view(
+                    self.shape, self.dtype, _compact_strides(self))
+                host_ary[...] = ary
+
+                _memcpy_discontig(self, host_ary, async_=async_, stream=stream)
+                if async_:
+                    staging.record(staging_buf, stream)
+            else:
+                _memcpy_discontig(self, ary, async_=async_, stream=stream)
 
     def set_async(self, ary, stream=None):
         return self.set(ary, async_=True, stream=stream)
@@ -356,6 +539,10 @@ class GPUArray:
 
         # }}}
 
+        use_staging = (
+            pagelocked and ary is not None and not async_
+            and not _is_pagelocked(ary))
+
         if ary is None:
             if pagelocked:
                 ary = drv.pagelocked_empty(self.shape, self.dtype)
@@ -382,22 +569,79 @@ class GPUArray:
                 raise TypeError("self and ary must have the same dtype")
 
         if self.size:
-            _memcpy_discontig(ary, self, async_=async_, stream=stream)
+            staging_buf = None
+            if use_staging:
+                try:
+                    staging_buf = _get_pinned_staging_buffers().get(self.nbytes)
+                except drv.MemoryError:
+                    pass
+
+            if staging_buf is not None:
+                host_ary = staging_buf.view(
+                    self.shape, self.dtype, _compact_strides(self))
+
+                _memcpy_discontig(host_ary, self)
+                ary[...] = host_ary
+            else:
+                _memcpy_discontig(ary, self, async_=async_, stream=stream)
         return ary
 
     def get_async(self, stream=None, ary=None):
-        return self.get(ary=ary, async_=True, stream=stream)
+        return self.get(ary=ary, pagelocked=ary is None, async_=True,
+                stream=stream)
 
-    def copy(self):
+    def copy(self, stream=None):
         new = GPUArray(self.shape, self.dtype, self.allocator)
-        _memcpy_discontig(new, self)
+        _memcpy_discontig(new, self, async_=stream is not None, stream=stream)
         return new
 
+    def _get_for_printing(self):
+        """Return a host copy of *self* for :func:`str` and :func:`repr`.
+
+        If numpy would summarize the array, only the entries it displays are
+        transferred. The remainder of the host array is left uninitialized
+        and, being allocated lazily, does not occupy memory.
+        """
+        printoptions = np.get_printoptions()
+        if self.size <= printoptions["threshold"]:
+            return self.get()
+
+        edgeitems = printoptions["edgeitems"]
+        axis_slices = [
+            [slice(None, edgeitems), slice(n - edgeitems, None)]
+            if n > 2 * edgeitems else [slice(None)]
+            for n in self.shape]
+
+        from itertools import product
+
+        result = np.empty(self.shape, self.dtype)
+        for idx in product(*axis_slices):
+            self._get_region_for_printing(result, idx)
+
+        return result
+
+    def _get_region_for_printing(self, result, idx):
+        try:
+            result[idx] = self[idx].get()
+        except ValueError:
+            # the region has too many discontiguous axes to be copied at
+            # once, copy it one index of its leading axis at a time
+            for axis, (slc, n) in enumerate(zip(idx, self.shape)):
+                indices = range(*slc.indices(n))
+                if len(indices) > 1:
+                    break
+            else:
+                raise
+
+            for i in indices:
+                self._get_region_for_printing(result,
+                        idx[:axis] + (slice(i, i + 1),) + idx[axis + 1:])
+
     def __str__(self):
-        return str(self.get())
+        return str(self._get_for_printing())
 
     def __repr__(self):
-        return repr(self.get())
+        return repr(self._get_for_printing())
 
     def __hash__(self):
         raise TypeError("GPUArrays are not hashable.")
@@ -424,34 +668,44 @@ class GPUArray:
         assert ((self.shape == other.shape == out.shape)
             or ((self.shape == ()) and other.shape == out.shape)
             or ((other.shape == ()) and self.shape == out.shape))
-        func = elementwise.get_axpbyz_kernel(
-            self.dtype, other.dtype, out.dtype,
-            x_is_scalar=(self.shape == ()),
-            y_is_scalar=(other.shape == ()))
+        restrict = not _overlaps(out, self, other)
+        if _is_float4_vectorizable(self, other, out):
+            func = elementwise.get_axpbyz_float4_kernel(restrict)
+            n = out.size // 4
+            grid, block = splay(n)
+        else:
+            func = elementwise.get_axpbyz_kernel(
+                self.dtype, other.dtype, out.dtype,
+                x_is_scalar=(self.shape == ()),
+                y_is_scalar=(other.shape == ()),
+                restrict=restrict)
+            grid, block, n = out._grid, out._block, out.mem_size
+
         if add_timer is not None:
             add_timer(
                 3 * self.size,
                 func.prepared_timed_call(
-                    out._grid,
+                    grid,
+                    block,
                     selffac,
-                    out.gpudata,
+                    self.gpudata,
                     otherfac,
                     other.gpudata,
                     out.gpudata,
-                    out.mem_size,
+                    n,
                 ),
             )
         else:
             func.prepared_async_call(
-                out._grid,
-                out._block,
+                grid,
+                block,
                 stream,
                 selffac,
                 self.gpudata,
                 otherfac,
                 other.gpudata,
                 out.gpudata,
-                out.mem_size,
+                n,
             )
 
         return out
@@ -464,49 +718,101 @@ class GPUArray:
                 "only contiguous arrays may " "be used as arguments to this operation"
             )
 
-        func = elementwise.get_axpbz_kernel(self.dtype, out.dtype)
+        restrict = not _overlaps(out, self)
+        if _is_float4_vectorizable(self, out):
+            func = elementwise.get_axpbz_float4_kernel(restrict)
+            n = self.size // 4
+            grid, block = splay(n)
+        else:
+            func = elementwise.get_axpbz_kernel(self.dtype, out.dtype, restrict)
+            grid, block, n = self._grid, self._block, self.mem_size
+
         func.prepared_async_call(
-            self._grid,
-            self._block,
+            grid,
+            block,
             stream,
             selffac,
             self.gpudata,
             other,
             out.gpudata,
-            self.mem_size,
+            n,
         )
 
         return out
 
-    def _elwise_multiply(self, other, out, stream=None):
+    def _ax(self, selffac, out, stream=None):
+        """Compute ``out = selffac * self``."""
+
         if not self.flags.forc:
             raise RuntimeError(
                 "only contiguous arrays may " "be used as arguments to this operation"
             )
+
+        restrict = not _overlaps(out, self)
+        if _is_float4_vectorizable(self, out):
+            func = elementwise.get_scale_float4_kernel(restrict)
+            n = self.size // 4
+            grid, block = splay(n)
+        else:
+            func = elementwise.get_scale_kernel(self.dtype, out.dtype, restrict)
+            grid, block, n = self._grid, self._block, self.mem_size
+
+        func.prepared_async_call(
+            grid,
+            block,
+            stream,
+            selffac,
+            self.gpudata,
+            out.gpudata,
+            n,
+        )
+
+        return out
+
+    def _elwise_binary_op(self, other, out, operator, stream=None):
+        """Compute ``out = self (operator) other``, where `other` is a vector."""
+
+        if not self.flags.forc or not other.flags.forc:
+            raise RuntimeError(
+                "only contiguous arrays may " "be used as arguments to this operation"
+            )
+
         assert ((self.shape == other.shape == out.shape)
             or ((self.shape == ()) and other.shape == out.shape)
             or ((other.shape == ()) and self.shape == out.shape))
 
-        func = elementwise.get_binary_op_kernel(
-            self.dtype,
-            other.dtype,
-            out.dtype,
-            "*",
-            x_is_scalar=(self.shape == ()),
-            y_is_scalar=(other.shape == ()))
+        restrict = not _overlaps(out, self, other)
+        if _is_float4_vectorizable(self, other, out):
+            func = elementwise.get_binary_op_float4_kernel(operator, restrict)
+            n = out.size // 4
+            grid, block = splay(n)
+        else:
+            func = elementwise.get_binary_op_kernel(
+                self.dtype,
+                other.dtype,
+                out.dtype,
+                operator,
+                x_is_scalar=(self.shape == ()),
+                y_is_scalar=(other.shape == ()),
+                restrict=restrict)
+            grid, block, n = out._grid, out._block, out.mem_size
 
         func.prepared_async_call(
-            out._grid,
-            out._block,
+            grid,
+            block,
             stream,
             self.gpudata,
             other.gpudata,
             out.gpudata,
-            out.mem_size,
+            n,
         )
 
         return out
 
+    def _elwise_multiply(self, other, out, stream=None):
+        """Multiplies an array by another array."""
+        return self._elwise_binary_op(other, out, "*", stream)
+
     def _rdiv_scalar(self, other, out, stream=None):
         """Divides an array by a scalar::
 
@@ -533,34 +839,7 @@ class GPUArray:
 
     def _div(self, other, out, stream=None):
         """Divides an array by another array."""
-
-        if not self.flags.forc or not other.flags.forc:
-            raise RuntimeError(
-                "only contiguous arrays may " "be used as arguments to this operation"
-            )
-
-        assert ((self.shape == other.shape == out.shape)
-            or ((self.shape == ()) and other.shape == out.shape)
-            or ((other.shape == ()) and self.shape == out.shape))
-
-        func = elementwise.get_binary_op_kernel(
-            self.dtype,
-            other.dtype,
-            out.dtype,
-            "/",
-            x_is_scalar=(self.shape == ()),
-            y_is_scalar=(other.shape == ()))
-        func.prepared_async_call(
-            out._grid,
-            out._block,
-            stream,
-            self.gpudata,
-            other.gpudata,
-            out.gpudata,
-            out.mem_size,
-        )
-
-        return out
+        return self._elwise_binary_op(other, out, "/", stream)
 
     def _new_like_me(self, dtype=None, order="C"):
         strides = None
@@ -577,7 +856,7 @@ class GPUArray:
     def mul_add(self, selffac, other, otherfac, add_timer=None, stream=None):
         """Return `selffac * self + otherfac*other`."""
         result = self._new_like_me(_get_common_dtype(self, other))
-        return self._axpbyz(selffac, other, otherfac, result, add_timer)
+        return self._axpbyz(selffac, other, otherfac, result, add_timer, stream)
 
     def __add__(self, other):
         """Add an array with an array or an array with a scalar."""
@@ -585,9 +864,9 @@ class GPUArray:
         if isinstance(other, GPUArray):
             # add another vector
             result = _get_broadcasted_binary_op_result(self, other)
-            return self._axpbyz(1, other, 1, result)
+            return self._elwise_binary_op(other, result, "+")
 
-        elif np.isscalar(other):
+        elif _is_scalar(other):
             # add a scalar
             if other == 0:
                 return self.copy()
@@ -603,14 +882,14 @@ class GPUArray:
 
         if isinstance(other, GPUArray):
             result = _get_broadcasted_binary_op_result(self, other)
-            return self._axpbyz(1, other, -1, result)
-        elif np.isscalar(other):
+            return self._elwise_binary_op(other, result, "-")
+        elif _is_scalar(other):
             if other == 0:
                 return self.copy()
             else:
                 # create a new array for the result
                 result = self._new_like_me(_get_common_dtype(self, other))
-                return self._axpbz(1, -other, result)
+                return self._axpbz(1, _negate_scalar(other, result.dtype), result)
         else:
             return NotImplemented
 
@@ -619,48 +898,53 @@ class GPUArray:
 
         x = n - self
         """
-        # other must be a scalar
+        if not _is_scalar(other):
+            return NotImplemented
+
         result = self._new_like_me(_get_common_dtype(self, other))
         return self._axpbz(-1, other, result)
 
     def __iadd__(self, other):
         if isinstance(other, GPUArray):
-            return self._axpbyz(1, other, 1, self)
+            return self._elwise_binary_op(other, self, "+")
         else:
             return self._axpbz(1, other, self)
 
     def __isub__(self, other):
         if isinstance(other, GPUArray):
-            return self._axpbyz(1, other, -1, self)
+            return self._elwise_binary_op(other, self, "-")
         else:
-            return self._axpbz(1, -other, self)
+            return self._axpbz(1, _negate_scalar(other, self.dtype), self)
 
     def __pos__(self):
         return self
 
     def __neg__(self):
         result = self._new_like_me()
-        return self._axpbz(-1, 0, result)
+        return self._ax(-1, result)
 
     def __mul__(self, other):
         if isinstance(other, GPUArray):
             result = _get_broadcasted_binary_op_result(self, other)
             return self._elwise_multiply(other, result)
-        elif np.isscalar(other):
+        elif _is_scalar(other):
             result = self._new_like_me(_get_common_dtype(self, other))
-            return self._axpbz(other, 0, result)
+            return self._ax(other, result)
         else:
             return NotImplemented
 
     def __rmul__(self, scalar):
+        if not _is_scalar(scalar):
+            return NotImplemented
+
         result = self._new_like_me(_get_common_dtype(self, scalar))
-        return self._axpbz(scalar, 0, result)
+        return self._ax(scalar, result)
 
     def __imul__(self, other):
         if isinstance(other, GPUArray):
             return self._elwise_multiply(other, self)
         else:
-            return self._axpbz(other, 0, self)
+            return self._ax(other, self)
 
     def __div__(self, other):
         """Divides an array by an array or a scalar::
@@ -670,13 +954,13 @@ class GPUArray:
         if isinstance(other, GPUArray):
             result = _get_broadcasted_binary_op_result(self, other)
             return self._div(other, result)
-        elif np.isscalar(other):
+        elif _is_scalar(other):
             if other == 1:
                 return self.copy()
             else:
                 # create a new array for the result
                 result = self._new_like_me(_get_common_dtype(self, other))
-                return self._axpbz(1 / other, 0, result)
+                return self._ax(1 / other, result)
         else:
             return NotImplemented
     __truediv__ = __div__
@@ -686,9 +970,15 @@ class GPUArray:
 
         x = n / self
         """
-        # create a new array for the result
-        result = self._new_like_me(_get_common_dtype(self, other))
-        return self._rdiv_scalar(other, result)
+        if isinstance(other, GPUArray):
+            result = _get_broadcasted_binary_op_result(other, self)
+            return other._div(self, result)
+        elif _is_scalar(other):
+            # create a new array for the result
+            result = self._new_like_me(_get_common_dtype(self, other))
+            return self._rdiv_scalar(other, result)
+        else:
+            return NotImplemented
 
     __rtruediv__ = __rdiv__
 
@@ -703,7 +993,7 @@ class GPUArray:
             if other == 1:
                 return self
             else:
-                return self._axpbz(1 / other, 0, self)
+                return self._ax(1 / other, self)
 
     __itruediv__ = __idiv__
 
@@ -713,6 +1003,26 @@ class GPUArray:
             raise RuntimeError(
                 "only contiguous arrays may be used as arguments to this operation")
 
+        if self.size == 0:
+            return self
+
+        # If the byte pattern of *value* is a repeated 8, 16 or 32-bit word,
+        # let the driver's memset write it, avoiding a kernel launch.
+        pattern = np.array(value, dtype=self.dtype).reshape(1).view(np.uint8)
+        for word_dtype, memset in [
+                (np.uint32, drv.memset_d32_async),
+                (np.uint16, drv.memset_d16_async),
+                (np.uint8, drv.memset_d8_async)]:
+            word_size = np.dtype(word_dtype).itemsize
+            if self.dtype.itemsize % word_size or self.ptr % word_size:
+                continue
+
+            words = pattern.view(word_dtype)
+            if (words == words[0]).all():
+                memset(self.gpudata, int(words[0]), self.nbytes // word_size,
+                        stream)
+                return self
+
         func = elementwise.get_fill_kernel(self.dtype)
         func.prepared_async_call(
             self._grid, self._block, stream, value, self.gpudata, self.mem_size
@@ -1235,7 +1545,7 @@ class GPUArray:
         else:
             return zeros_like(self)
 
-    def conj(self, out=None):
+    def conj(self, out=None, stream=None):
         dtype = self.dtype
         if issubclass(self.dtype.type, np.complexfloating):
             if not self.flags.forc:
@@ -1257,7 +1567,7 @@ class GPUArray:
             func.prepared_async_call(
                 self._grid,
                 self._block,
-                None,
+                stream,
                 self.gpudata,
                 result.gpudata,
                 self.mem_size,
@@ -1289,10 +1599,10 @@ class GPUArray:
 # {{{ creation helpers
 
 
-def to_gpu(ary, allocator=drv.mem_alloc):
+def to_gpu(ary, allocator=drv.mem_alloc, pagelocked=False):
     """converts a numpy array to a GPUArray"""
     result = GPUArray(ary.shape, ary.dtype, allocator, strides=_compact_strides(ary))
-    result.set(ary)
+    result.set(ary, pagelocked=pagelocked)
     return result
 
 
@@ -1396,6 +1706,8 @@ def arange(*args, **kwargs):
         pass
 
     explicit_dtype = False
+    stream = kwargs.pop("stream", None)
+    allocator = kwargs.pop("allocator", None) or drv.mem_alloc
 
     inf = Info()
     inf.start = None
@@ -1460,13 +1772,13 @@ def arange(*args, **kwargs):
 
     size = int(ceil((stop - start) / step))
 
-    result = GPUArray((size,), dtype)
+    result = GPUArray((size,), dtype, allocator)
 
     func = elementwise.get_arange_kernel(dtype)
     func.prepared_async_call(
         result._grid,
         result._block,
-        kwargs.get("stream"),
+        stream,
         result.gpudata,
         start,
         step,
@@ -1668,7 +1980,7 @@ def multi_take(arrays, indices, out=None, stream=None):
     from pytools import single_valued
 
     a_dtype = single_valued(a.dtype for a in arrays)
-    a_allocator = arrays[0].dtype
+    a_allocator = arrays[0].allocator
 
     vec_count = len(arrays)
 
@@ -1962,6 +2274,58 @@ def reshape(a, *shape, **kwargs):
 # }}}
 
 
+# {{{ linear combination
+
+
+def linear_combination(summands, out=None, stream=None):
+    """Return ``a0*x0 + a1*x1 + ...`` for *summands* ``[(a0, x0), (a1, x1), ...]``,
+    where the *ai* are scalars and the *xi* are :class:`GPUArray` instances of
+    equal shape.
+
+    Unlike chaining arithmetic operators, this evaluates the whole expression
+    in a single kernel launch, without materializing intermediate results.
+
+    .. versionadded:: 2022.2
+    """
+    summands = list(summands)
+    if not summands:
+        raise ValueError("need at least one summand")
+
+    vectors = [x for _, x in summands]
+
+    import builtins
+    if not builtins.all(x.flags.forc for x in vectors):
+        raise RuntimeError(
+            "only contiguous arrays may be used as arguments to this operation")
+    if not builtins.all(x.shape == vectors[0].shape for x in vectors[1:]):
+        raise ValueError("arrays must have the same shape")
+
+    dtype = reduce(np.promote_types,
+                   (_get_common_dtype(x, a) for a, x in summands))
+
+    if out is None:
+        out = vectors[0]._new_like_me(dtype)
+    elif out.shape != vectors[0].shape:
+        raise ValueError("out must have the same shape as the summands")
+
+    func, _ = elementwise.get_linear_combination_kernel(
+        tuple((False, out.dtype, x.dtype) for x in vectors), out.dtype)
+
+    args = []
+    for a, x in summands:
+        args.append(out.dtype.type(a))
+        args.append(x.gpudata)
+    args.append(out.gpudata)
+    args.append(out.mem_size)
+
+    func.prepared_async_call(out._grid, out._block, stream, *args)
+
+    return out
+
+
+# }}}
+
+
 # {{{ conditionals
 
 
@@ -2140,7 +2504,7 @@ subset_max = _make_subset_minmax_kernel("max")
 
 # {{{ logical ops
 
-def _logical_op(x1, x2, out, allocator, operator):
+def _logical_op(x1, x2, out, allocator, operator, stream=None):
     assert operator in ["&&", "||"]
     allocator = (
         allocator
@@ -2173,7 +2537,7 @@ def _logical_op(x1, x2, out, allocator, operator):
                                                 operator)
 
         func.prepared_async_call(out._grid, out._block,
-                                 None,
+                                 stream,
                                  ary_arg.gpudata,
                                  scalar_arg,
                                  out.gpudata,
@@ -2194,7 +2558,7 @@ def _logical_op(x1, x2, out, allocator, operator):
             x1.dtype, x2.dtype, out.dtype, operator
         )
         func.prepared_async_call(out._grid, out._block,
-                                 None,
+                                 stream,
                                  x1.gpudata,
                                  x2.gpudata,
                                  out.gpudata,
@@ -2203,15 +2567,15 @@ def _logical_op(x1, x2, out, allocator, operator):
     return out
 
 
-def logical_and(x1, x2, /, out=None, *, allocator=None):
-    return _logical_op(x1, x2, out, allocator, "&&")
+def logical_and(x1, x2, /, out=None, *, allocator=None, stream=None):
+    return _logical_op(x1, x2, out, allocator, "&&", stream)
 
 
-def logical_or(x1, x2, /, out=None, *, allocator=None):
-    return _logical_op(x1, x2, out, allocator, "||")
+def logical_or(x1, x2, /, out=None, *, allocator=None, stream=None):
+    return _logical_op(x1, x2, out, allocator, "||", stream)
 
 
-def logical_not(x, /, out=None, *, allocator=drv.mem_alloc):
+def logical_not(x, /, out=None, *, allocator=drv.mem_alloc, stream=None):
     if np.isscalar(x):
         out = out or empty(shape=(), dtype=np.bool_, allocator=allocator)
         out[:] = np.logical_not(x)
@@ -2219,7 +2583,7 @@ def logical_not(x, /, out=None, *, allocator=drv.mem_alloc):
         out = out or empty(shape=x.shape, dtype=np.bool_, allocator=allocator)
         func = elementwise.get_logical_not_kernel(x.dtype, out.dtype)
         func.prepared_async_call(out._grid, out._block,
-                                 None,
+                                 stream,
                                  x.gpudata,
                                  out.gpudata,
                                  out.mem_size)
@@ -2228,4 +2592,62 @@ def logical_not(x, /, out=None, *, allocator=drv.mem_alloc):
 
 # }}}
 
+
+# {{{ kernel pre-warming
+
+def _compile_common_kernels():
+    """Compile (or load from the compiler cache) the kernels used by the
+    arithmetic operators on float32 arrays, with the arguments used by the
+    operators so that they end up in the same memoization slots.
+    """
+    f32 = np.dtype(np.float32)
+
+    elementwise.get_axpbyz_kernel(f32, f32, f32,
+            x_is_scalar=False, y_is_scalar=False, restrict=True)
+    elementwise.get_axpbyz_float4_kernel(True)
+    elementwise.get_axpbz_kernel(f32, f32, True)
+    elementwise.get_axpbz_float4_kernel(True)
+    elementwise.get_scale_kernel(f32, f32, True)
+    elementwise.get_scale_float4_kernel(True)
+
+    for operator in "+-*/":
+        elementwise.get_binary_op_kernel(f32, f32, f32, operator,
+                x_is_scalar=False, y_is_scalar=False, restrict=True)
+        elementwise.get_binary_op_float4_kernel(operator, True)
+
+
+def _prewarm_kernels(ctx):
+    ctx.push()
+    try:
+        _compile_common_kernels()
+    except Exception as e:
+        from warnings import warn
+        warn("pre-warming GPUArray kernels failed: %s" % e)
+    finally:
+        drv.Context.pop()
+
+
+def _start_kernel_prewarming():
+    import os
+
+    if not os.environ.get("PYCUDA_PREWARM"):
+        return
+
+    ctx = drv.Context.get_current()
+    if ctx is None:
+        return
+
+    import atexit
+    import threading
+
+    thread = threading.Thread(target=_prewarm_kernels, args=(ctx,), daemon=True)
+    thread.start()
+    # keep the context alive until the thread is done with it
+    atexit.register(thread.join)
+
+
+_start_kernel_prewarming()
+
+# }}}
+
 # vim: foldmethod=marker
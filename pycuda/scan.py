@@ -402,7 +402,8 @@ class _ScanKernelBase:
             output_ary = input_ary
 
         if isinstance(output_ary, (str, str)) and output_ary == "new":
-            output_ary = gpuarray.empty_like(input_ary, allocator=allocator)
+            output_ary = gpuarray.empty(
+                    input_ary.shape, input_ary.dtype, allocator=allocator)
 
         if input_ary.shape != output_ary.shape:
             raise ValueError("input and output must have the same shape")
@@ -90,66 +90,70 @@ class TestMath:
     @mark_cuda_test
     def test_fmod(self):
         """tests if the fmod function works"""
-        for s in sizes:
-            a = gpuarray.arange(s, dtype=np.float32) / 10
-            a2 = gpuarray.arange(s, dtype=np.float32) / 45.2 + 0.1
-            b = cumath.fmod(a, a2)
+        for dtype in dtypes:
+            for s in sizes:
+                a = gpuarray.arange(s, dtype=dtype) / 10
+                a2 = gpuarray.arange(s, dtype=dtype) / 45.2 + 0.1
+                b = cumath.fmod(a, a2)
 
-            a = a.get()
-            a2 = a2.get()
-            b = b.get()
+                a = a.get()
+                a2 = a2.get()
+                b = b.get()
 
-            for i in range(s):
-                assert math.fmod(a[i], a2[i]) == b[i]
+                for i in range(s):
+                    assert math.fmod(a[i], a2[i]) == b[i]
 
     @mark_cuda_test
     def test_ldexp(self):
         """tests if the ldexp function works"""
-        for s in sizes:
-            a = gpuarray.arange(s, dtype=np.float32)
-            a2 = gpuarray.arange(s, dtype=np.float32) * 1e-3
-            b = cumath.ldexp(a, a2)
+        for dtype in dtypes:
+            for s in sizes:
+                a = gpuarray.arange(s, dtype=dtype)
+                a2 = gpuarray.arange(s, dtype=dtype) * 1e-3
+                b = cumath.ldexp(a, a2)
 
-            a = a.get()
-            a2 = a2.get()
-            b = b.get()
+                a = a.get()
+                a2 = a2.get()
+                b = b.get()
 
-            for i in range(s):
-                assert math.ldexp(a[i], int(a2[i])) == b[i]
+                for i in range(s):
+                    assert math.ldexp(a[i], int(a2[i])) == b[i]
 
     @mark_cuda_test
     def test_modf(self):
         """tests if the modf function works"""
-        for s in sizes:
-            a = gpuarray.arange(s, dtype=np.float32) / 10
-            fracpart, intpart = cumath.modf(a)
+        for dtype in dtypes:
+            for s in sizes:
+                a = gpuarray.arange(s, dtype=dtype) / 10
+                fracpart, intpart = cumath.modf(a)
 
-            a = a.get()
-            intpart = intpart.get()
-            fracpart = fracpart.get()
+                a = a.get()
+                intpart = intpart.get()
+                fracpart = fracpart.get()
 
-            for i in range(s):
-                fracpart_true, intpart_true = math.modf(a[i])
+                for i in range(s):
+                    fracpart_true, intpart_true = math.modf(a[i])
 
-                assert intpart_true == intpart[i]
-                assert abs(fracpart_true - fracpart[i]) < 1e-4
+                    assert intpart_true == intpart[i]
+                    assert abs(fracpart_true - fracpart[i]) < 1e-4
 
     @mark_cuda_test
     def test_frexp(self):
         """tests if the frexp function works"""
-        for s in sizes:
-            a = gpuarray.arange(s, dtype=np.float32) / 10
-            significands, exponents = cumath.frexp(a)
+        for dtype in dtypes:
+            for s in sizes:
+                a = gpuarray.arange(s, dtype=dtype) / 10
+                significands, exponents = cumath.frexp(a)
 
-            a = a.get()
-            significands = significands.get()
-            exponents = exponents.get()
+                a = a.get()
+                significands = significands.get()
+                exponents = exponents.get()
 
-            for i in range(s):
-                sig_true, ex_true = math.frexp(a[i])
+                for i in range(s):
+                    sig_true, ex_true = math.frexp(a[i])
 
-                assert sig_true == significands[i]
-                assert ex_true == exponents[i]
+                    assert sig_true == significands[i]
+                    assert ex_true == exponents[i]
 
     @mark_cuda_test
     def test_unary_func_kwargs(self):
@@ -1128,6 +1128,53 @@ def test_pass_cai_array():
     assert (host_array == np_array).all()
 
 
+def test_cache_key_include_detection():
+    from pycuda.compiler import (
+        _find_pycuda_include_path, _includes_only_pycuda_headers)
+
+    pycuda_inc = "-I" + _find_pycuda_include_path()
+    source = "#include <pycuda-complex.hpp>\n__global__ void f() {}\n"
+
+    assert _includes_only_pycuda_headers(source, [pycuda_inc])
+    assert not _includes_only_pycuda_headers(source, [pycuda_inc, "-I/usr/inc"])
+    assert not _includes_only_pycuda_headers(
+        "#include <stdio.h>\n" + source, [pycuda_inc])
+    assert not _includes_only_pycuda_headers(
+        "#include MY_HEADER\n" + source, [pycuda_inc])
+    for option in ["-isystem/usr/inc", "--system-include=/usr/inc"]:
+        assert not _includes_only_pycuda_headers(source, [pycuda_inc, option])
+
+
+@mark_cuda_test
+def test_cache_file_permissions(tmp_path):
+    import os
+
+    SourceModule("__global__ void f() {}", cache_dir=str(tmp_path))
+
+    umask = os.umask(0)
+    os.umask(umask)
+    cache_files = os.listdir(tmp_path)
+    assert cache_files
+    for name in cache_files:
+        assert not name.endswith(".tmp")
+        mode = os.stat(os.path.join(tmp_path, name)).st_mode & 0o777
+        assert mode == 0o666 & ~umask
+
+
+@mark_cuda_test
+def test_cache_write_failure(tmp_path, monkeypatch):
+    import os
+
+    def fail_replace(src, dst):
+        raise PermissionError("cache file in use")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+
+    mod = SourceModule("__global__ void f() {}", cache_dir=str(tmp_path))
+    mod.get_function("f")
+    assert not os.listdir(tmp_path)
+
+
 def test_import_pyopencl_before_pycuda():
     try:
         import pyopencl  # noqa
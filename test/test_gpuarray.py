@@ -168,6 +168,17 @@ class TestGPUArray:
         np.testing.assert_allclose(+a_gpu.get(), +a, rtol=1e-6)
         np.testing.assert_allclose(-a_gpu.get(), -a, rtol=1e-6)
 
+    def test_scale_signed_zero(self):
+        a = np.array([0, 1, -1, 0, 2, 3, 0, 4], dtype=np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+
+        for result, expected in [
+                (-a_gpu, -a), (a_gpu * -1, a * -1), (-2 * a_gpu[1:], -2 * a[1:]),
+                (a_gpu / -4, a / -4)]:
+            result = result.get()
+            assert (result == expected).all()
+            assert (np.signbit(result) == np.signbit(expected)).all()
+
     def test_addition_array(self):
         """Test the addition of two arrays."""
 
@@ -197,6 +208,22 @@ class TestGPUArray:
 
         assert (a + a == a_added).all()
 
+    def test_isubtraction_array(self):
+        """Test the inplace subtraction of two arrays."""
+
+        a = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10]).astype(np.float32)
+        b = np.array([10, 20, 30, 40, 50, 60, 70, 80, 90, 100]).astype(np.float32)
+        c = np.array(3).astype(np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+        b_gpu = gpuarray.to_gpu(b)
+        c_gpu = gpuarray.to_gpu(c)
+
+        a_gpu -= b_gpu
+        assert (a - b == a_gpu.get()).all()
+
+        a_gpu += c_gpu
+        assert (a - b + c == a_gpu.get()).all()
+
     def test_addition_scalar(self):
         """Test the addition of an array and a scalar."""
 
@@ -254,6 +281,42 @@ class TestGPUArray:
         result = (7 - a_gpu).get()
         assert (7 - a == result).all()
 
+    def test_scalar_type_dispatch(self):
+        a = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10]).astype(np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+
+        for scalar in [3, 3.0, np.float32(3), np.float64(3), np.int32(3),
+                np.int64(3), np.uint8(3)]:
+            assert ((a_gpu + scalar).get() == a + np.float32(3)).all()
+            assert ((a_gpu - scalar).get() == a - np.float32(3)).all()
+            assert ((scalar - a_gpu).get() == np.float32(3) - a).all()
+            assert ((a_gpu * scalar).get() == a * np.float32(3)).all()
+
+            b_gpu = a_gpu.copy()
+            b_gpu -= scalar
+            assert (b_gpu.get() == a - np.float32(3)).all()
+
+        # subtracting from unsigned arrays wraps around, as in numpy
+        a = np.arange(10, dtype=np.uint8)
+        a_gpu = gpuarray.to_gpu(a)
+
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for scalar in [3, np.uint8(3)]:
+                result = (a_gpu - scalar).get()
+                assert result.dtype == np.uint8
+                assert (result == a - np.uint8(3)).all()
+
+                b_gpu = a_gpu.copy()
+                b_gpu -= scalar
+                assert (b_gpu.get() == a - np.uint8(3)).all()
+
+        with pytest.raises(TypeError):
+            object() - a_gpu
+        with pytest.raises(TypeError):
+            object() * a_gpu
+
     def test_divide_scalar(self):
         """Test the division of an array and a scalar."""
 
@@ -290,6 +353,63 @@ class TestGPUArray:
         a_divide = (c_gpu / a_gpu).get()
         assert (np.abs(c / a - a_divide) < 1e-3).all()
 
+        a_divide = a_gpu.__rtruediv__(b_gpu).get()
+        assert (np.abs(b / a - a_divide) < 1e-3).all()
+
+        assert a_gpu.__rtruediv__(object()) is NotImplemented
+
+    def test_mul_add(self):
+        a = np.arange(10, dtype=np.float32)
+        b = np.arange(10, 20, dtype=np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+        b_gpu = gpuarray.to_gpu(b)
+
+        result = a_gpu.mul_add(2, b_gpu, 3)
+        np.testing.assert_allclose(result.get(), 2*a + 3*b, rtol=1e-6)
+
+        times = []
+        result = a_gpu.mul_add(2, b_gpu, 3,
+                               add_timer=lambda _, t: times.append(t()))
+        np.testing.assert_allclose(result.get(), 2*a + 3*b, rtol=1e-6)
+        assert len(times) == 1 and times[0] >= 0
+
+    def test_linear_combination(self):
+        a = np.arange(10, dtype=np.float32)
+        b = np.arange(10, 20, dtype=np.float32)
+        c = np.arange(20, 30, dtype=np.float32)
+
+        a_gpu = gpuarray.to_gpu(a)
+        b_gpu = gpuarray.to_gpu(b)
+        c_gpu = gpuarray.to_gpu(c)
+
+        result = gpuarray.linear_combination(
+            [(2, a_gpu), (-3, b_gpu), (0.5, c_gpu)])
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result.get(), 2*a - 3*b + 0.5*c, rtol=1e-6)
+
+        out = gpuarray.empty_like(a_gpu)
+        gpuarray.linear_combination([(1, a_gpu), (1, b_gpu)], out=out)
+        np.testing.assert_allclose(out.get(), a + b, rtol=1e-6)
+
+    def test_float4_vectorized_arithmetic(self):
+        a = np.random.rand(4096).astype(np.float32) + 1
+        b = np.random.rand(4096).astype(np.float32) + 1
+        a_gpu = gpuarray.to_gpu(a)
+        b_gpu = gpuarray.to_gpu(b)
+
+        np.testing.assert_allclose((a_gpu + b_gpu).get(), a + b, rtol=1e-6)
+        np.testing.assert_allclose((a_gpu - b_gpu).get(), a - b, rtol=1e-6)
+        np.testing.assert_allclose((a_gpu * b_gpu).get(), a * b, rtol=1e-6)
+        np.testing.assert_allclose((a_gpu / b_gpu).get(), a / b, rtol=1e-6)
+        np.testing.assert_allclose((2 * a_gpu + 1).get(), 2 * a + 1,
+                rtol=1e-6)
+
+        # views that are not 16-byte aligned take the scalar path
+        np.testing.assert_allclose((a_gpu[2:6] * b_gpu[2:6]).get(),
+                a[2:6] * b[2:6], rtol=1e-6)
+        np.testing.assert_allclose((a_gpu[2:6] + 1).get(), a[2:6] + 1,
+                rtol=1e-6)
+
     def test_random(self):
         from pycuda.curandom import rand as curand
 
@@ -518,6 +638,27 @@ class TestGPUArray:
 
             assert la.norm(a_cpu - a_gpu.get()) == 0, i
 
+    def test_elwise_kernel_launch_bounds(self):
+        from pycuda.elementwise import ElementwiseKernel
+
+        add_one = ElementwiseKernel(
+            "float *x, float *z", "z[i] = x[i] + 1", "add_one",
+            max_threads_per_block=64,
+        )
+
+        a = np.random.rand(1 << 20).astype(np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+        z_gpu = gpuarray.empty_like(a_gpu)
+
+        add_one(a_gpu, z_gpu)
+        assert (z_gpu.get() == a + 1).all()
+
+        z_gpu.fill(0)
+        add_one(a_gpu, z_gpu, slice=slice(5, 100000, 3))
+        z = np.zeros_like(a)
+        z[5:100000:3] = a[5:100000:3] + 1
+        assert (z_gpu.get() == z).all()
+
     def test_take(self):
         idx = gpuarray.arange(0, 10000, 2, dtype=np.uint32)
         for dtype in [np.float32, np.complex64]:
@@ -539,6 +680,19 @@ class TestGPUArray:
         np.testing.assert_allclose(ones, ones_gpu.get(), rtol=1e-6)
         assert ones.dtype == ones_gpu.dtype
 
+    @pytest.mark.parametrize("dtype,value", [
+        (np.float32, 3.5), (np.float64, 0), (np.float64, 1.5),
+        (np.int16, 7), (np.int8, -1), (np.complex64, 1j)])
+    def test_fill(self, dtype, value):
+        a_gpu = gpuarray.empty(37, dtype)
+        a_gpu.fill(value)
+        assert (a_gpu.get() == np.full(37, value, dtype)).all()
+
+        # unaligned view
+        a_gpu[1:].fill(0)
+        assert a_gpu[0].get() == dtype(value)
+        assert (a_gpu[1:].get() == 0).all()
+
     @pytest.mark.parametrize("order", ["F", "C"])
     @pytest.mark.parametrize("input_dims", [0, 1, 2])
     def test_stack(self, order, input_dims):
@@ -1216,6 +1370,29 @@ class TestGPUArray:
         assert dot_gpu_1.allocator == a_gpu.allocator
         assert dot_gpu_2.allocator == pool.allocate
 
+    def test_temporaries_use_allocator(self):
+        import pycuda.tools
+        import pycuda.cumath as cumath
+
+        pool = pycuda.tools.DeviceMemoryPool()
+
+        a_gpu = gpuarray.arange(1, 65, dtype=np.float32,
+                allocator=pool.allocate)
+        assert a_gpu.allocator == pool.allocate
+
+        results = [
+                a_gpu + a_gpu, 2 * a_gpu,
+                cumath.fmod(a_gpu, a_gpu), cumath.ldexp(a_gpu, a_gpu),
+                *cumath.frexp(a_gpu), *cumath.modf(a_gpu),
+                *gpuarray.multi_take([a_gpu],
+                    gpuarray.arange(4, dtype=np.int32))]
+        for result in results:
+            assert result.allocator == pool.allocate
+
+        # release pooled memory while the context is still active
+        del a_gpu, results, result
+        pool.free_held()
+
     def test_view_and_strides(self):
         from pycuda.curandom import rand as curand
 
@@ -1283,6 +1460,23 @@ class TestGPUArray:
         assert b_gpu.shape == b.shape
         assert b_gpu.strides == b.strides
 
+    def test_stream_keyword(self):
+        stream = drv.Stream()
+
+        a = (np.random.rand(100) + 1j * np.random.rand(100)).astype(np.complex64)
+        a_gpu = gpuarray.to_gpu(a)
+
+        a_copy = a_gpu.copy(stream=stream)
+        a_conj = a_gpu.conj(stream=stream)
+        a_and = gpuarray.logical_and(a_gpu.real, 0.5, stream=stream)
+        a_not = gpuarray.logical_not(a_gpu.real, stream=stream)
+        stream.synchronize()
+
+        assert np.array_equal(a_copy.get(), a)
+        assert np.array_equal(a_conj.get(), a.conj())
+        assert np.array_equal(a_and.get(), np.logical_and(a.real, 0.5))
+        assert np.array_equal(a_not.get(), np.logical_not(a.real))
+
     def test_copy(self):
         from pycuda.curandom import rand as curand
 
@@ -1334,6 +1528,118 @@ class TestGPUArray:
         assert np.allclose(a_gpu.get(), a)
         assert np.allclose(a_gpu[1:3, 1:3, 1:3].get(), a[1:3, 1:3, 1:3])
 
+    def test_kernel_prewarming(self):
+        import threading
+        import warnings
+        from pycuda import elementwise
+        from pycuda.tools import clear_context_caches
+
+        clear_context_caches()
+
+        ctx = drv.Context.get_current()
+        with warnings.catch_warnings():
+            # a failed compile only warns in the pre-warming thread
+            warnings.simplefilter("error")
+            gpuarray._compile_common_kernels()
+
+            thread = threading.Thread(target=gpuarray._prewarm_kernels,
+                    args=(ctx,))
+            thread.start()
+            thread.join()
+
+        def memoized(func):
+            return func.__wrapped__._pycuda_ctx_dep_memoize_dic[ctx]
+
+        f32 = np.dtype(np.float32)
+        assert ((f32, f32, True),) in memoized(elementwise.get_axpbz_kernel)
+        assert ((True,),) in memoized(elementwise.get_axpbz_float4_kernel)
+        assert ((True,),) in memoized(elementwise.get_scale_float4_kernel)
+        for op in "+-*/":
+            assert ((op, True),) in memoized(
+                    elementwise.get_binary_op_float4_kernel)
+            assert ((f32, f32, f32, op), frozenset(dict(
+                    x_is_scalar=False, y_is_scalar=False,
+                    restrict=True).items())) in memoized(
+                    elementwise.get_binary_op_kernel)
+
+        a = np.random.rand(64).astype(np.float32)
+        a_gpu = gpuarray.to_gpu(a)
+        np.testing.assert_allclose((a_gpu * a_gpu + 2 * a_gpu).get(),
+                a * a + 2 * a, rtol=1e-6)
+
+    def test_get_set_pagelocked_staging(self):
+        for a in [
+                np.random.normal(0.0, 1.0, (4, 4)),
+                np.random.normal(0.0, 1.0, (4, 4, 4)).transpose((1, 2, 0)),
+                # larger than the first: the staging buffer has to grow
+                np.random.normal(0.0, 1.0, (100, 100)),
+                ]:
+            a_gpu = gpuarray.to_gpu(a, pagelocked=True)
+            assert np.array_equal(a_gpu.get(), a)
+
+            result = np.empty_like(a)
+            a_gpu.get(ary=result, pagelocked=True)
+            assert np.array_equal(result, a)
+
+            a_gpu.set(2*a, pagelocked=True)
+            assert np.array_equal(a_gpu.get(), 2*a)
+
+    def test_async_staging_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(gpuarray, "_STAGING_BUFFER_NBYTES", 1 << 12)
+        staging = gpuarray._get_pinned_staging_buffers()
+
+        streams = [drv.Stream() for i in range(4)]
+        arys = [np.random.rand(256).astype(np.float32) for stream in streams]
+        arys_gpu = [gpuarray.empty_like(a) for a in arys]
+        for a, a_gpu, stream in zip(arys, arys_gpu, streams):
+            a_gpu.set_async(a, stream=stream)
+
+        assert len(staging.reusable) <= gpuarray._STAGING_BUFFER_COUNT
+
+        # larger transfers are not staged, or staged through a temporary
+        # buffer if pagelocked is requested
+        big = np.random.rand(1 << 12)
+        big_gpu = gpuarray.empty_like(big)
+        big_gpu.set_async(big, stream=streams[0])
+        big_gpu.set(2*big, pagelocked=True, async_=True, stream=streams[1])
+        assert len(staging.pending) == 1
+
+        drv.Context.synchronize()
+        for a, a_gpu in zip(arys, arys_gpu):
+            assert np.array_equal(a_gpu.get(), a)
+        assert np.array_equal(big_gpu.get(), 2*big)
+
+        staging.get(1)
+        assert not staging.pending
+        assert all(buf.buffer.nbytes <= 1 << 12 for buf in staging.reusable)
+
+    def test_async_transfers(self):
+        stream = drv.Stream()
+        a = np.random.normal(0.0, 1.0, (64, 64))
+
+        a_gpu = gpuarray.to_gpu_async(a, stream=stream)
+        # the source may be modified once the call returns
+        a_orig = a.copy()
+        a[...] = 0
+
+        result = a_gpu.get_async(stream=stream)
+        stream.synchronize()
+        assert np.array_equal(result, a_orig)
+        assert isinstance(result.base, drv.PagelockedHostAllocation)
+
+    @pytest.mark.parametrize("shape",
+            [(10,), (2000,), (30, 40), (5, 300, 7), (20, 20, 20, 20)])
+    def test_str_repr(self, shape):
+        a = np.arange(np.prod(shape), dtype=np.float32).reshape(shape)
+        a_gpu = gpuarray.to_gpu(a)
+
+        assert str(a_gpu) == str(a)
+        assert repr(a_gpu) == repr(a)
+
+        a_t = a.T
+        a_t_gpu = a_gpu.T
+        assert str(a_t_gpu) == str(a_t)
+
     def test_zeros_like_etc(self):
         shape = (16, 16)
         a = np.random.randn(*shape).astype(np.float32)